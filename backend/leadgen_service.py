@@ -43,9 +43,9 @@ import hashlib
 import requests
 from typing import List, Dict, Any, Optional, Callable
 
-from fastapi import FastAPI, BackgroundTasks
+from fastapi import FastAPI, BackgroundTasks, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse, JSONResponse
+from fastapi.responses import StreamingResponse, JSONResponse, Response
 from pydantic import BaseModel
 from motor.motor_asyncio import AsyncIOMotorClient
 
@@ -1171,7 +1171,7 @@ def trigger_leadgen(req: RunRequest, background: BackgroundTasks):
     return {"job_id": job_id, "status": "queued"}
 
 @app.get("/status/{job_id}")
-def leadgen_status(job_id: str):
+def leadgen_status(job_id: str, request: Request):
     job = JOBS.get(job_id)
     if not job:
         return JSONResponse({"error": "job not found"}, status_code=404)
@@ -1180,7 +1180,12 @@ def leadgen_status(job_id: str):
         res["summary"] = job["result"].get("summary", "Processing...")
         res["counts"] = job["result"].get("counts", {})
         res["lead_ids"] = [p["lead_id"] for p in job["result"].get("posted", [])]
-    return res
+    # ETag over the response body so pollers can send If-None-Match and get an empty 304 until the job changes
+    body = json.dumps(res, sort_keys=True, default=str)
+    etag = '"' + hashlib.sha1(body.encode()).hexdigest() + '"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
 
 @app.get("/stream/{job_id}")
 async def leadgen_stream(job_id: str):
@@ -11,7 +11,7 @@ from email_validator import validate_email, EmailNotValidError
 from twilio.rest import Client as TwilioClient
 from openpyxl import load_workbook
 
-from fastapi import FastAPI, HTTPException, Request, Header, File, UploadFile, Form
+from fastapi import FastAPI, HTTPException, Request, Header, File, UploadFile, Form, Query
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse, StreamingResponse, Response, Response
@@ -42,6 +42,9 @@ from secrets_manager import (
 # Import draft activity manager
 from draft_activity_manager import update_draft_activity as update_draft_activity_impl
 
+# Import phone normalization (kept dependency-free so tests can call it directly)
+from phone import E164_RE, normalize_e164 as normalize_phone
+
 # Load environment from backend/.env if present
 load_dotenv()
 
@@ -319,8 +322,6 @@ except Exception as e:
         pass
     raise
 
-E164_RE = re.compile(r"^\+[1-9]\d{7,14}$")
-
 # --- Models ---
 class UserOut(BaseModel):
     id: str
@@ -622,6 +623,14 @@ class UpdateLeadRequest(BaseModel):
 class UpdateStageRequest(BaseModel):
     stage: str
 
+class BulkDeleteLeadsRequest(BaseModel):
+    user_id: str
+    ids: List[str] = Field(..., min_length=1)  # Wiping a user outright is /api/_test/reset_leads' job
+
+class ResetLeadsRequest(BaseModel):
+    user_id: str
+    leads: List[Dict[str, Any]] = []
+
 class Settings(BaseModel):
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
     user_id: str
@@ -2096,31 +2105,6 @@ Your Real Estate Agent"""
 # --- End Email Communication Endpoints ---
 
 # --- Utils ---
-def normalize_phone(phone_str):
-    """Normalize phone number to E.164 format"""
-    if not phone_str:
-        return None
-    
-    # Remove all non-digit characters
-    digits = re.sub(r'\D', '', phone_str)
-    
-    # If already has E.164 format, return as is
-    if phone_str.startswith('+') and E164_RE.match(phone_str):
-        return phone_str
-    
-    # Handle US numbers (10 or 11 digits)
-    if len(digits) == 10:
-        return f"+1{digits}"
-    elif len(digits) == 11 and digits.startswith('1'):
-        return f"+{digits}"
-    
-    # If it looks like it might be international but missing +, try adding it
-    if len(digits) >= 7 and len(digits) <= 15:
-        return f"+{digits}"
-    
-    # Return original if can't normalize
-    return phone_str
-
 async def get_user_by_email(email: str) -> Optional[Dict[str, Any]]:
     return await db.users.find_one({"email": email})
 
@@ -2202,6 +2186,54 @@ async def on_startup():
         except Exception as e:
             print(f"   ⚠ Leads user_id index creation error: {e}")
         
+        try:
+            print("   → Creating leads name lookup index...")
+            await asyncio.wait_for(
+                db.leads.create_index([("user_id", 1), ("first_name", 1), ("last_name", 1)]),
+                timeout=10.0
+            )
+            print("   ✓ Leads name lookup index created")
+        except asyncio.TimeoutError:
+            print("   ⚠ Leads name lookup index creation timeout - may already exist")
+        except Exception as e:
+            print(f"   ⚠ Leads name lookup index creation error: {e}")
+        
+        try:
+            print("   → Creating leads source index...")
+            await asyncio.wait_for(
+                db.leads.create_index([("user_id", 1), ("lead_source", 1)]),
+                timeout=10.0
+            )
+            print("   ✓ Leads source index created")
+        except asyncio.TimeoutError:
+            print("   ⚠ Leads source index creation timeout - may already exist")
+        except Exception as e:
+            print(f"   ⚠ Leads source index creation error: {e}")
+        
+        try:
+            print("   → Creating leads source tags index...")
+            await asyncio.wait_for(
+                db.leads.create_index([("user_id", 1), ("source_tags", 1)]),
+                timeout=10.0
+            )
+            print("   ✓ Leads source tags index created")
+        except asyncio.TimeoutError:
+            print("   ⚠ Leads source tags index creation timeout - may already exist")
+        except Exception as e:
+            print(f"   ⚠ Leads source tags index creation error: {e}")
+        
+        try:
+            print("   → Creating audit logs idempotency key index...")
+            await asyncio.wait_for(
+                db.audit_logs.create_index([("idempotency_key", 1)]),
+                timeout=10.0
+            )
+            print("   ✓ Audit logs idempotency key index created")
+        except asyncio.TimeoutError:
+            print("   ⚠ Audit logs idempotency key index creation timeout - may already exist")
+        except Exception as e:
+            print(f"   ⚠ Audit logs idempotency key index creation error: {e}")
+        
         # partial unique only when email exists as string
         print("   → Checking for old email index...")
         try:
@@ -2524,8 +2556,27 @@ async def get_current_user(authorization: Optional[str] = Header(None)):
     }
 
 @app.get("/api/leads", response_model=List[Lead])
-async def list_leads(user_id: str):
-    cursor = db.leads.find({"user_id": user_id})
+async def list_leads(user_id: str, first_name: Optional[str] = Query(None), last_name: Optional[str] = Query(None),
+                     phone: Optional[str] = Query(None), lead_source: Optional[str] = Query(None),
+                     source_tag: Optional[str] = Query(None), limit: Optional[int] = Query(None, ge=1)):
+    query = {"user_id": user_id}
+    if lead_source is not None:
+        query["lead_source"] = lead_source
+    if source_tag is not None:
+        # Matches leads whose source_tags array contains the tag
+        query["source_tags"] = source_tag
+    if first_name is not None:
+        query["first_name"] = first_name
+    if last_name is not None:
+        query["last_name"] = last_name
+    if phone is not None:
+        # Stored phones are E.164, so match on the normalized form of whatever was passed
+        query["phone"] = normalize_phone(phone) or phone
+    cursor = db.leads.find(query)
+    if limit is not None:
+        # Callers that only need a sample (e.g. schema checks) skip loading every lead; ge=1 rejects
+        # 0 and negatives, which Mongo would treat as "no limit" and "single batch"
+        cursor = cursor.limit(limit)
     leads = []
     async for doc in cursor:
         leads.append(Lead(**{k: v for k, v in doc.items() if k != "_id"}))
@@ -3040,6 +3091,13 @@ async def import_leads_csv(
     print(f"Import completed: {inserted} inserted, {skipped} skipped")
     return ImportResult(inserted=inserted, skipped=skipped, errors=errors, inserted_leads=inserted_docs)
 
+@app.get("/api/leads/{lead_id}", response_model=Lead)
+async def get_lead(lead_id: str):
+    doc = await db.leads.find_one({"id": lead_id})
+    if not doc:
+        raise HTTPException(status_code=404, detail="Lead not found")
+    return Lead(**{k: v for k, v in doc.items() if k != "_id"})
+
 @app.put("/api/leads/{lead_id}/stage", response_model=Lead)
 async def update_lead_stage(lead_id: str, payload: UpdateStageRequest):
     doc = await db.leads.find_one({"id": lead_id})
@@ -3072,6 +3130,23 @@ async def delete_lead(lead_id: str):
     await db.leads.delete_one({"id": lead_id})
     return {"ok": True}
 
+@app.post("/api/leads/bulk-delete")
+async def bulk_delete_leads(payload: BulkDeleteLeadsRequest):
+    # One delete_many scoped to the owner instead of a round trip per lead
+    result = await db.leads.delete_many({"user_id": payload.user_id, "id": {"$in": payload.ids}})
+    return {"deleted": result.deleted_count}
+
+# Test-only fixture reset; never mounted outside ENV=test
+if os.environ.get("ENV") == "test":
+    @app.post("/api/_test/reset_leads")
+    async def reset_leads(payload: ResetLeadsRequest):
+        # Scoped to one user rather than dropping the shared collection, which would also drop its indexes
+        result = await db.leads.delete_many({"user_id": payload.user_id})
+        docs = [Lead(**{**lead, "user_id": payload.user_id}).model_dump(exclude_none=True) for lead in payload.leads]
+        if docs:
+            await db.leads.insert_many(docs)
+        return {"deleted": result.deleted_count, "inserted": len(docs)}
+
 @app.get("/api/analytics/dashboard", response_model=AnalyticsDashboard)
 async def analytics_dashboard(user_id: str):
     stages = ["New", "Contacted", "Appointment", "Onboarded", "Closed"]
@@ -3990,6 +4065,16 @@ async def lead_intake_webhook(
             content={"status": "error", "message": str(e)}
         )
 
+@app.get("/api/webhooks/idempotency/{idempotency_key}")
+async def get_idempotency_result(idempotency_key: str, user_id: str):
+    """Return what the lead-intake webhook recorded for one of the user's Idempotency-Keys, without re-running it"""
+    audit = await db.audit_logs.find_one(
+        {"idempotency_key": idempotency_key, "user_id": user_id}, {"_id": 0, "intake_result": 1, "lead_id": 1}
+    )
+    if not audit:
+        raise HTTPException(status_code=404, detail="Idempotency key not found")
+    return {"status": "already_processed", "result": audit.get("intake_result"), "lead_id": audit.get("lead_id")}
+
 # --- Main Orchestrator AI Models and Collections ---
 
 class AgentRun(BaseModel):
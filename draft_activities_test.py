@@ -4,12 +4,12 @@ Draft Activities Integration Testing for RealtorsPal AI
 Tests the draft activities system where email/SMS drafts automatically create activities
 """
 
-import requests
 import sys
 import json
 import time
 from datetime import datetime
 from typing import Optional, Dict, Any, List
+from http_session import make_session
 
 class DraftActivitiesTester:
     def __init__(self, base_url: str = None):
@@ -29,6 +29,7 @@ class DraftActivitiesTester:
         
         self.base_url = base_url
         self.user_id = "03f82986-51af-460c-a549-1c5077e67fb0"  # Demo user ID
+        self.session = make_session("realtorspal-draft-activities-test")
         self.tests_run = 0
         self.tests_passed = 0
         self.test_lead_id: Optional[str] = None
@@ -57,7 +58,7 @@ class DraftActivitiesTester:
                 "neighborhood": "Test Area",
                 "priority": "high"
             }
-            response = requests.post(f"{self.base_url}/leads", json=payload, timeout=10)
+            response = self.session.post(f"{self.base_url}/leads", json=payload, timeout=10)
             
             if response.status_code == 200:
                 lead_data = response.json()
@@ -112,12 +113,12 @@ class DraftActivitiesTester:
             # or by triggering the nurturing service that creates drafts
             
             # Let's try the lead nurturing service to create drafts
-            response = requests.post(f"{self.base_url}/agents/nurture/run", json={"lead_id": self.test_lead_id}, timeout=10)
+            response = self.session.post(f"{self.base_url}/agents/nurture/run", json={"lead_id": self.test_lead_id}, timeout=10)
             
             if response.status_code == 200:
                 # The nurturing service should have created drafts
                 # Let's check if drafts were created
-                drafts_response = requests.get(f"{self.base_url}/email-drafts/{self.test_lead_id}", timeout=10)
+                drafts_response = self.session.get(f"{self.base_url}/email-drafts/{self.test_lead_id}", timeout=10)
                 if drafts_response.status_code == 200:
                     drafts = drafts_response.json()
                     if drafts:
@@ -145,13 +146,13 @@ class DraftActivitiesTester:
             # In a real scenario, this would be created by the nurturing AI service
             
             # Let's try to trigger SMS nurturing
-            response = requests.post(f"{self.base_url}/agents/nurture/run", 
+            response = self.session.post(f"{self.base_url}/agents/nurture/run", 
                                    json={"lead_id": self.test_lead_id, "channel": "sms"}, 
                                    timeout=10)
             
             if response.status_code == 200:
                 # Check if SMS drafts were created
-                drafts_response = requests.get(f"{self.base_url}/email-drafts/{self.test_lead_id}", timeout=10)
+                drafts_response = self.session.get(f"{self.base_url}/email-drafts/{self.test_lead_id}", timeout=10)
                 if drafts_response.status_code == 200:
                     drafts = drafts_response.json()
                     sms_drafts = [d for d in drafts if d.get("channel") == "sms"]
@@ -175,7 +176,7 @@ class DraftActivitiesTester:
             if not draft_id:
                 # If we can't create drafts via service, let's check if activities endpoint works
                 # and test the manual sync endpoint instead
-                sync_response = requests.post(f"{self.base_url}/draft-activities/sync/{self.test_lead_id}?user_id={self.user_id}", timeout=10)
+                sync_response = self.session.post(f"{self.base_url}/draft-activities/sync/{self.test_lead_id}?user_id={self.user_id}", timeout=10)
                 
                 if sync_response.status_code == 200:
                     self.log_test("Draft Activity Creation Email", True, "Manual sync endpoint works (draft creation via service not available)")
@@ -185,7 +186,7 @@ class DraftActivitiesTester:
                     return False
             
             # Check if activity was created in nurturing_activities collection
-            activities_response = requests.get(f"{self.base_url}/nurturing-ai/activities/{self.user_id}", timeout=10)
+            activities_response = self.session.get(f"{self.base_url}/nurturing-ai/activities/{self.user_id}", timeout=10)
             
             if activities_response.status_code == 200:
                 data = activities_response.json()
@@ -240,7 +241,7 @@ class DraftActivitiesTester:
             # If we couldn't create drafts via service, test the sync endpoint
             if not draft_ids:
                 # Test manual sync endpoint
-                sync_response = requests.post(f"{self.base_url}/draft-activities/sync/{self.test_lead_id}?user_id={self.user_id}", timeout=10)
+                sync_response = self.session.post(f"{self.base_url}/draft-activities/sync/{self.test_lead_id}?user_id={self.user_id}", timeout=10)
                 
                 if sync_response.status_code == 200:
                     self.log_test("Draft Count Synchronization", True, "Manual sync endpoint works (draft creation via service not available)")
@@ -250,7 +251,7 @@ class DraftActivitiesTester:
                     return False
             
             # Check activity draft count
-            activities_response = requests.get(f"{self.base_url}/nurturing-ai/activities/{self.user_id}", timeout=10)
+            activities_response = self.session.get(f"{self.base_url}/nurturing-ai/activities/{self.user_id}", timeout=10)
             
             if activities_response.status_code == 200:
                 data = activities_response.json()
@@ -298,7 +299,7 @@ class DraftActivitiesTester:
             if not draft_id:
                 # If we can't create drafts, test the endpoint structure
                 # Try to send a non-existent draft to test error handling
-                send_response = requests.post(f"{self.base_url}/email-drafts/send", 
+                send_response = self.session.post(f"{self.base_url}/email-drafts/send", 
                                             json={"draft_id": "non-existent-draft", "from_email": "test@example.com"}, 
                                             timeout=10)
                 
@@ -315,12 +316,12 @@ class DraftActivitiesTester:
                 "from_email": "agent@example.com"
             }
             
-            send_response = requests.post(f"{self.base_url}/email-drafts/send", json=send_payload, timeout=10)
+            send_response = self.session.post(f"{self.base_url}/email-drafts/send", json=send_payload, timeout=10)
             
             # The send might fail due to missing SendGrid config, but we're testing the activity update
             if send_response.status_code in [200, 400, 500]:  # Any response means endpoint exists
                 # Check if activity was updated (draft count should decrement)
-                activities_response = requests.get(f"{self.base_url}/nurturing-ai/activities/{self.user_id}", timeout=10)
+                activities_response = self.session.get(f"{self.base_url}/nurturing-ai/activities/{self.user_id}", timeout=10)
                 
                 if activities_response.status_code == 200:
                     data = activities_response.json()
@@ -365,7 +366,7 @@ class DraftActivitiesTester:
             
             if not draft_id:
                 # If we can't create drafts, test the delete endpoint structure
-                delete_response = requests.delete(f"{self.base_url}/email-drafts/non-existent-draft", timeout=10)
+                delete_response = self.session.delete(f"{self.base_url}/email-drafts/non-existent-draft", timeout=10)
                 
                 if delete_response.status_code == 404:
                     self.log_test("Delete Draft Activity Update", True, "Delete endpoint works (returns 404 for non-existent draft as expected)")
@@ -375,11 +376,11 @@ class DraftActivitiesTester:
                     return False
             
             # Try to delete the draft
-            delete_response = requests.delete(f"{self.base_url}/email-drafts/{draft_id}", timeout=10)
+            delete_response = self.session.delete(f"{self.base_url}/email-drafts/{draft_id}", timeout=10)
             
             if delete_response.status_code in [200, 404]:  # 200 = success, 404 = not found (both are valid responses)
                 # Check if activity was updated
-                activities_response = requests.get(f"{self.base_url}/nurturing-ai/activities/{self.user_id}", timeout=10)
+                activities_response = self.session.get(f"{self.base_url}/nurturing-ai/activities/{self.user_id}", timeout=10)
                 
                 if activities_response.status_code == 200:
                     data = activities_response.json()
@@ -421,7 +422,7 @@ class DraftActivitiesTester:
             sms_draft_id = self.create_sms_draft(urgency="urgent")
             
             # Check if SMS activity was created
-            activities_response = requests.get(f"{self.base_url}/nurturing-ai/activities/{self.user_id}", timeout=10)
+            activities_response = self.session.get(f"{self.base_url}/nurturing-ai/activities/{self.user_id}", timeout=10)
             
             if activities_response.status_code == 200:
                 data = activities_response.json()
@@ -448,7 +449,7 @@ class DraftActivitiesTester:
                 else:
                     # If we couldn't create SMS drafts, test that the endpoint structure supports it
                     # by checking if the sync endpoint handles SMS channel
-                    sync_response = requests.post(f"{self.base_url}/draft-activities/sync/{self.test_lead_id}?user_id={self.user_id}", timeout=10)
+                    sync_response = self.session.post(f"{self.base_url}/draft-activities/sync/{self.test_lead_id}?user_id={self.user_id}", timeout=10)
                     
                     if sync_response.status_code == 200:
                         self.log_test("SMS Draft Activity", True, "SMS channel supported in sync endpoint (SMS draft creation via service not available)")
@@ -468,7 +469,7 @@ class DraftActivitiesTester:
         """Test 6: Manual Sync Endpoint - /api/draft-activities/sync/{lead_id}"""
         try:
             # Test the manual sync endpoint
-            sync_response = requests.post(f"{self.base_url}/draft-activities/sync/{self.test_lead_id}?user_id={self.user_id}", timeout=10)
+            sync_response = self.session.post(f"{self.base_url}/draft-activities/sync/{self.test_lead_id}?user_id={self.user_id}", timeout=10)
             
             if sync_response.status_code == 200:
                 data = sync_response.json()
@@ -480,7 +481,7 @@ class DraftActivitiesTester:
                     return False
             elif sync_response.status_code == 404:
                 # Lead not found - test with invalid lead
-                invalid_sync = requests.post(f"{self.base_url}/draft-activities/sync/invalid-lead-id?user_id={self.user_id}", timeout=10)
+                invalid_sync = self.session.post(f"{self.base_url}/draft-activities/sync/invalid-lead-id?user_id={self.user_id}", timeout=10)
                 if invalid_sync.status_code == 404:
                     self.log_test("Manual Sync Endpoint", True, "Sync endpoint works (proper 404 for invalid lead)")
                     return True
@@ -499,7 +500,7 @@ class DraftActivitiesTester:
         """Test 7: GET Activities Endpoint - /api/nurturing-ai/activities/{user_id}"""
         try:
             # Test the activities endpoint
-            activities_response = requests.get(f"{self.base_url}/nurturing-ai/activities/{self.user_id}", timeout=10)
+            activities_response = self.session.get(f"{self.base_url}/nurturing-ai/activities/{self.user_id}", timeout=10)
             
             if activities_response.status_code == 200:
                 data = activities_response.json()
@@ -547,7 +548,7 @@ class DraftActivitiesTester:
             total_error_tests = 3
             
             # Test 1: Sync with non-existent lead
-            invalid_sync = requests.post(f"{self.base_url}/draft-activities/sync/non-existent-lead?user_id={self.user_id}", timeout=10)
+            invalid_sync = self.session.post(f"{self.base_url}/draft-activities/sync/non-existent-lead?user_id={self.user_id}", timeout=10)
             if invalid_sync.status_code == 404:
                 error_tests_passed += 1
                 print(f"  ✓ Non-existent lead sync returns 404")
@@ -556,7 +557,7 @@ class DraftActivitiesTester:
             
             # Test 2: Sync with no drafts (should work but show 0 count)
             if self.test_lead_id:
-                sync_no_drafts = requests.post(f"{self.base_url}/draft-activities/sync/{self.test_lead_id}?user_id={self.user_id}", timeout=10)
+                sync_no_drafts = self.session.post(f"{self.base_url}/draft-activities/sync/{self.test_lead_id}?user_id={self.user_id}", timeout=10)
                 if sync_no_drafts.status_code == 200:
                     error_tests_passed += 1
                     print(f"  ✓ Sync with no drafts works")
@@ -567,7 +568,7 @@ class DraftActivitiesTester:
                 print(f"  ✓ Skipped no-drafts test (no test lead)")
             
             # Test 3: Activities endpoint with invalid user
-            invalid_activities = requests.get(f"{self.base_url}/nurturing-ai/activities/invalid-user-id", timeout=10)
+            invalid_activities = self.session.get(f"{self.base_url}/nurturing-ai/activities/invalid-user-id", timeout=10)
             if invalid_activities.status_code == 200:  # Should return empty list, not error
                 data = invalid_activities.json()
                 if data.get("count", 0) == 0:
@@ -592,14 +593,14 @@ class DraftActivitiesTester:
             # Delete created drafts
             for draft_id in self.created_drafts:
                 try:
-                    requests.delete(f"{self.base_url}/email-drafts/{draft_id}", timeout=5)
+                    self.session.delete(f"{self.base_url}/email-drafts/{draft_id}", timeout=5)
                 except:
                     pass
             
             # Delete test lead
             if self.test_lead_id:
                 try:
-                    requests.delete(f"{self.base_url}/leads/{self.test_lead_id}", timeout=5)
+                    self.session.delete(f"{self.base_url}/leads/{self.test_lead_id}", timeout=5)
                 except:
                     pass
                     
@@ -637,6 +638,7 @@ class DraftActivitiesTester:
         
         # Cleanup
         self.cleanup()
+        self.session.close()
         
         # Summary
         print("=" * 80)
@@ -0,0 +1,23 @@
+"""
+Shared requests session setup for the standalone RealtorsPal AI test scripts
+"""
+
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Gateway errors and read failures are retried for GETs only, so the lead-creating and
+# agent-executing POSTs are never sent twice; a failed connect sent nothing and is always retried
+GET_RETRY = Retry(total=2, backoff_factor=0.2, status_forcelist=(502, 503, 504),
+                  allowed_methods=frozenset({"GET"}), raise_on_status=False)
+
+def make_session(user_agent: str, retry: Optional[Retry] = None) -> requests.Session:
+    """One keep-alive session for every test in a script, so the connection (and TLS handshake) is reused"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=4, max_retries=retry or 0)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update({"Accept": "application/json", "User-Agent": user_agent})
+    return session
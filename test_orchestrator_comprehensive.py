@@ -4,11 +4,11 @@ Comprehensive test of the Main Orchestrator AI Live Activity Stream system
 Tests all MongoDB collections and logging features
 """
 
-import requests
 import sys
 import json
 import time
 from datetime import datetime
+from http_session import GET_RETRY, make_session
 
 class ComprehensiveOrchestratorTester:
     def __init__(self):
@@ -24,6 +24,7 @@ class ComprehensiveOrchestratorTester:
             self.base_url = "http://localhost:8001/api"  # fallback
         
         self.demo_user_id = "03f82986-51af-460c-a549-1c5077e67fb0"
+        self.session = make_session("realtorspal-orchestrator-test", retry=GET_RETRY)
         self.tests_run = 0
         self.tests_passed = 0
         self.created_lead_ids = []
@@ -52,7 +53,7 @@ class ComprehensiveOrchestratorTester:
             "priority": "high"
         }
         
-        response = requests.post(f"{self.base_url}/leads", json=lead_payload, timeout=10)
+        response = self.session.post(f"{self.base_url}/leads", json=lead_payload, timeout=10)
         if response.status_code == 200:
             lead_data = response.json()
             lead_id = lead_data.get("id")
@@ -76,7 +77,7 @@ class ComprehensiveOrchestratorTester:
                 "lead_id": lead_id,
                 "user_id": self.demo_user_id
             }
-            response = requests.post(f"{self.base_url}/orchestrator/execute-agent", params=execute_params, timeout=15)
+            response = self.session.post(f"{self.base_url}/orchestrator/execute-agent", params=execute_params, timeout=15)
             
             if response.status_code != 200:
                 self.log_test("Agent Run Creation", False, f"Execute agent failed: {response.text}")
@@ -86,7 +87,7 @@ class ComprehensiveOrchestratorTester:
             time.sleep(2)
             
             # Check that agent runs were created
-            runs_response = requests.get(f"{self.base_url}/orchestrator/agent-runs/{self.demo_user_id}", timeout=10)
+            runs_response = self.session.get(f"{self.base_url}/orchestrator/agent-runs/{self.demo_user_id}", timeout=10)
             if runs_response.status_code != 200:
                 self.log_test("Agent Run Creation", False, f"Failed to get agent runs: {runs_response.text}")
                 return False
@@ -140,7 +141,7 @@ class ComprehensiveOrchestratorTester:
                 "lead_id": lead_id,
                 "user_id": self.demo_user_id
             }
-            response = requests.post(f"{self.base_url}/orchestrator/execute-agent", params=execute_params, timeout=15)
+            response = self.session.post(f"{self.base_url}/orchestrator/execute-agent", params=execute_params, timeout=15)
             
             if response.status_code != 200:
                 self.log_test("Agent Events Logging", False, f"Execute agent failed: {response.text}")
@@ -150,7 +151,7 @@ class ComprehensiveOrchestratorTester:
             time.sleep(2)
             
             # Get activity stream to see events
-            stream_response = requests.get(f"{self.base_url}/orchestrator/live-activity-stream/{self.demo_user_id}", timeout=10)
+            stream_response = self.session.get(f"{self.base_url}/orchestrator/live-activity-stream/{self.demo_user_id}", timeout=10)
             if stream_response.status_code != 200:
                 self.log_test("Agent Events Logging", False, f"Failed to get activity stream: {stream_response.text}")
                 return False
@@ -216,7 +217,7 @@ class ComprehensiveOrchestratorTester:
                 "lead_id": lead_id,
                 "user_id": self.demo_user_id
             }
-            response = requests.post(f"{self.base_url}/orchestrator/execute-agent", params=execute_params, timeout=15)
+            response = self.session.post(f"{self.base_url}/orchestrator/execute-agent", params=execute_params, timeout=15)
             
             if response.status_code != 200:
                 self.log_test("Agent Tasks Creation", False, f"Execute agent failed: {response.text}")
@@ -226,7 +227,7 @@ class ComprehensiveOrchestratorTester:
             time.sleep(2)
             
             # Get agent tasks
-            tasks_response = requests.get(f"{self.base_url}/orchestrator/agent-tasks/{self.demo_user_id}", timeout=10)
+            tasks_response = self.session.get(f"{self.base_url}/orchestrator/agent-tasks/{self.demo_user_id}", timeout=10)
             if tasks_response.status_code != 200:
                 self.log_test("Agent Tasks Creation", False, f"Failed to get agent tasks: {tasks_response.text}")
                 return False
@@ -293,7 +294,7 @@ class ComprehensiveOrchestratorTester:
                     "lead_id": lead_id,
                     "user_id": self.demo_user_id
                 }
-                response = requests.post(f"{self.base_url}/orchestrator/execute-agent", params=execute_params, timeout=15)
+                response = self.session.post(f"{self.base_url}/orchestrator/execute-agent", params=execute_params, timeout=15)
                 
                 if response.status_code != 200:
                     self.log_test("Live Activity Stream Integration", False, f"Execute {agent_code} failed: {response.text}")
@@ -305,7 +306,7 @@ class ComprehensiveOrchestratorTester:
             time.sleep(3)
             
             # Get live activity stream
-            stream_response = requests.get(f"{self.base_url}/orchestrator/live-activity-stream/{self.demo_user_id}?limit=20", timeout=10)
+            stream_response = self.session.get(f"{self.base_url}/orchestrator/live-activity-stream/{self.demo_user_id}?limit=20", timeout=10)
             if stream_response.status_code != 200:
                 self.log_test("Live Activity Stream Integration", False, f"Failed to get activity stream: {stream_response.text}")
                 return False
@@ -361,7 +362,7 @@ class ComprehensiveOrchestratorTester:
                 return False
             
             # Get initial lead data
-            initial_response = requests.get(f"{self.base_url}/leads?user_id={self.demo_user_id}", timeout=10)
+            initial_response = self.session.get(f"{self.base_url}/leads?user_id={self.demo_user_id}", timeout=10)
             if initial_response.status_code != 200:
                 self.log_test("Lead Updates Integration", False, f"Failed to get initial leads: {initial_response.text}")
                 return False
@@ -383,7 +384,7 @@ class ComprehensiveOrchestratorTester:
                 "lead_id": lead_id,
                 "user_id": self.demo_user_id
             }
-            response = requests.post(f"{self.base_url}/orchestrator/execute-agent", params=execute_params, timeout=15)
+            response = self.session.post(f"{self.base_url}/orchestrator/execute-agent", params=execute_params, timeout=15)
             
             if response.status_code != 200:
                 self.log_test("Lead Updates Integration", False, f"Execute agent failed: {response.text}")
@@ -425,8 +426,11 @@ class ComprehensiveOrchestratorTester:
             self.test_lead_updates_integration,
         ]
         
-        for test in tests:
-            test()
+        try:
+            for test in tests:
+                test()
+        finally:
+            self.session.close()
         
         print("=" * 80)
         print(f"📊 Results: {self.tests_passed}/{self.tests_run} tests passed")
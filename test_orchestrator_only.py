@@ -3,11 +3,11 @@
 Test only the Main Orchestrator AI Live Activity Stream system
 """
 
-import requests
 import sys
 import json
 import time
 from datetime import datetime
+from http_session import GET_RETRY, make_session
 
 class OrchestratorTester:
     def __init__(self):
@@ -23,6 +23,7 @@ class OrchestratorTester:
             self.base_url = "http://localhost:8001/api"  # fallback
         
         self.demo_user_id = "03f82986-51af-460c-a549-1c5077e67fb0"
+        self.session = make_session("realtorspal-orchestrator-test", retry=GET_RETRY)
         self.tests_run = 0
         self.tests_passed = 0
 
@@ -38,7 +39,7 @@ class OrchestratorTester:
     def test_orchestrator_live_activity_stream(self) -> bool:
         """Test GET /api/orchestrator/live-activity-stream/{user_id}"""
         try:
-            response = requests.get(f"{self.base_url}/orchestrator/live-activity-stream/{self.demo_user_id}", timeout=10)
+            response = self.session.get(f"{self.base_url}/orchestrator/live-activity-stream/{self.demo_user_id}", timeout=10)
             
             if response.status_code == 200:
                 data = response.json()
@@ -66,7 +67,7 @@ class OrchestratorTester:
     def test_orchestrator_agent_runs(self) -> bool:
         """Test GET /api/orchestrator/agent-runs/{user_id}"""
         try:
-            response = requests.get(f"{self.base_url}/orchestrator/agent-runs/{self.demo_user_id}", timeout=10)
+            response = self.session.get(f"{self.base_url}/orchestrator/agent-runs/{self.demo_user_id}", timeout=10)
             
             if response.status_code == 200:
                 data = response.json()
@@ -94,7 +95,7 @@ class OrchestratorTester:
     def test_orchestrator_agent_tasks(self) -> bool:
         """Test GET /api/orchestrator/agent-tasks/{user_id}"""
         try:
-            response = requests.get(f"{self.base_url}/orchestrator/agent-tasks/{self.demo_user_id}", timeout=10)
+            response = self.session.get(f"{self.base_url}/orchestrator/agent-tasks/{self.demo_user_id}", timeout=10)
             
             if response.status_code == 200:
                 data = response.json()
@@ -135,7 +136,7 @@ class OrchestratorTester:
                 "pipeline": "warm / nurturing",
                 "priority": "high"
             }
-            lead_response = requests.post(f"{self.base_url}/leads", json=lead_payload, timeout=10)
+            lead_response = self.session.post(f"{self.base_url}/leads", json=lead_payload, timeout=10)
             
             if lead_response.status_code != 200:
                 self.log_test("Orchestrator Execute Agent Nurturing", False, f"Failed to create test lead: {lead_response.text}")
@@ -154,7 +155,7 @@ class OrchestratorTester:
                 "lead_id": lead_id,
                 "user_id": self.demo_user_id
             }
-            response = requests.post(f"{self.base_url}/orchestrator/execute-agent", params=execute_params, timeout=15)
+            response = self.session.post(f"{self.base_url}/orchestrator/execute-agent", params=execute_params, timeout=15)
             
             if response.status_code == 200:
                 data = response.json()
@@ -198,8 +199,11 @@ class OrchestratorTester:
             self.test_orchestrator_execute_agent_nurturing,
         ]
         
-        for test in tests:
-            test()
+        try:
+            for test in tests:
+                test()
+        finally:
+            self.session.close()
         
         print("=" * 60)
         print(f"📊 Results: {self.tests_passed}/{self.tests_run} tests passed")